@@ -1,12 +1,17 @@
+import os
 import sys
-from PySide6.QtWidgets import QApplication
-from editor.workspace.paths import ensure_app_identity, debug_paths
 
 def main():
+    from PySide6.QtWidgets import QApplication
+    from editor.workspace import ensure_app_identity
+
     app = QApplication(sys.argv)
     ensure_app_identity("Chihara Yakou", "CLDL Editor")
-    debug_paths()
-    
+    # Set CLDL_DEBUG_PATHS=1 to print the resolved workspace paths at startup.
+    if os.environ.get("CLDL_DEBUG_PATHS"):
+        from editor.workspace import debug_paths
+        debug_paths()
+
     from editor.ui.main_window import MainWindow
     window = MainWindow()
     window.show()
@@ -1,57 +1,63 @@
+from typing import NamedTuple
+
 from PySide6.QtGui import QAction, QKeySequence
 
-def build_menubar(window):
+_SK_OPEN = QKeySequence.Open
+_SK_SAVE = QKeySequence.Save
+_SK_SAVEAS = QKeySequence.SaveAs
+_SK_QUIT = QKeySequence.Quit
+
+class Actions(NamedTuple):
+    new: QAction
+    open: QAction
+    save: QAction
+    save_as: QAction
+    import_: QAction
+    export_folder: QAction
+    exit: QAction
+    validate: QAction
+    about: QAction
+
+# (menu title, entries); an entry is (Actions field, text, shortcut, window handler) or None for a separator.
+_MENU_SPEC = (
+    ("File", (
+        ("new", "New Project…", None, "action_new_project"),
+        ("open", "Open…", _SK_OPEN, "action_open_project"),
+        None,
+        ("save", "Save", _SK_SAVE, "action_save_project"),
+        ("save_as", "Save As…", _SK_SAVEAS, "action_save_as"),
+        None,
+        ("import_", "Import…", None, "action_import"),
+        ("export_folder", "Export as Folder…", None, "action_export_folder"),
+        None,
+        ("exit", "Exit", _SK_QUIT, "close"),
+    )),
+    ("Edit", ()),
+    ("View", ()),
+    ("Tools", (
+        ("validate", "Validate Project", None, "action_validate"),
+    )),
+    ("Help", (
+        ("about", "About", None, "action_about"),
+    )),
+)
+
+def build_menubar(window) -> Actions:
     menubar = window.menuBar()
-
-    file_menu = menubar.addMenu("File")
-    edit_menu = menubar.addMenu("Edit")
-    view_menu = menubar.addMenu("View")
-    tools_menu = menubar.addMenu("Tools")
-    help_menu = menubar.addMenu("Help")
-
     actions = {}
 
-    # File
-    actions["new"] = QAction("New Project…", window)
-    actions["open"] = QAction("Open…", window)
-    actions["save"] = QAction("Save", window)
-    actions["save_as"] = QAction("Save As…", window)
-    actions["import"] = QAction("Import…", window)
-    actions["export_folder"] = QAction("Export as Folder…", window)
-    actions["exit"] = QAction("Exit", window)
-
-    actions["open"].setShortcut(QKeySequence.Open)
-    actions["save"].setShortcut(QKeySequence.Save)
-    actions["save_as"].setShortcut(QKeySequence.SaveAs)
-    actions["exit"].setShortcut(QKeySequence.Quit)
-
-    file_menu.addAction(actions["new"])
-    file_menu.addAction(actions["open"])
-    file_menu.addSeparator()
-    file_menu.addAction(actions["save"])
-    file_menu.addAction(actions["save_as"])
-    file_menu.addSeparator()
-    file_menu.addAction(actions["import"])
-    file_menu.addAction(actions["export_folder"])
-    file_menu.addSeparator()
-    file_menu.addAction(actions["exit"])
-
-    # Tools
-    actions["validate"] = QAction("Validate Project", window)
-    tools_menu.addAction(actions["validate"])
-
-    # Help
-    actions["about"] = QAction("About", window)
-    help_menu.addAction(actions["about"])
-
-    actions["new"].triggered.connect(window.action_new_project)
-    actions["open"].triggered.connect(window.action_open_project)
-    actions["save"].triggered.connect(window.action_save_project)
-    actions["save_as"].triggered.connect(window.action_save_as)
-    actions["import"].triggered.connect(window.action_import)
-    actions["export_folder"].triggered.connect(window.action_export_folder)
-    actions["validate"].triggered.connect(window.action_validate)
-    actions["about"].triggered.connect(window.action_about)
-    actions["exit"].triggered.connect(window.close)
-
-    return actions
\ No newline at end of file
+    for title, entries in _MENU_SPEC:
+        menu = menubar.addMenu(title)
+        for entry in entries:
+            if entry is None:
+                menu.addSeparator()
+                continue
+            key, text, shortcut, handler = entry
+            action = QAction(text, window)
+            if shortcut is not None:
+                action.setShortcut(shortcut)
+            action.triggered.connect(getattr(window, handler))
+            menu.addAction(action)
+            actions[key] = action
+
+    return Actions(**actions)
\ No newline at end of file
@@ -0,0 +1,37 @@
+# Workspace paths and identity. Everything except ensure_app_identity is loaded on first use.
+import importlib
+
+from ._identity import ensure_app_identity
+
+_LAZY = {
+    "AppDirs": "._workspace",
+    "app_local_data_root": "._workspace",
+    "ensure_base_dirs": "._workspace",
+    "invalidate_app_dirs": "._workspace",
+    "new_project_uid": "._workspace",
+    "invalidate_resolved": "._workspace",
+    "invalidate_workspace": "._workspace",
+    "is_uuid": "._workspace",
+    "project_key": "._workspace",
+    "WorkspaceHandle": "._workspace",
+    "open_workspace": "._workspace",
+    "workspace_root": "._workspace",
+    "unpacked_dir": "._workspace",
+    "lock_path": "._workspace",
+    "session_path": "._workspace",
+    "pack_temp_path": "._workspace",
+    "debug_paths": "._workspace",
+}
+
+__all__ = ["ensure_app_identity", *_LAZY]
+
+def __getattr__(name):
+    if name in _LAZY:
+        module = importlib.import_module(_LAZY[name], __name__)
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+def __dir__():
+    return sorted(__all__)
@@ -0,0 +1,31 @@
+# Who is the application? Qt organisation/application names decide where AppLocalData lives.
+from __future__ import annotations
+import sys
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from PySide6.QtCore import QCoreApplication
+
+def _require_qapp() -> QCoreApplication:
+    "Returns the running Qt application; raises if it has not been created yet."
+    from PySide6.QtCore import QCoreApplication
+    app = QCoreApplication.instance()
+    if app is None:
+        raise RuntimeError("QApplication must be created before using workspace paths")
+    return app
+
+def ensure_app_identity(org_name: str, app_name: str) -> None:
+    """
+    Ensures that Qt knows the name of the organisation and application.
+    This affects the AppLocalDataLocation path (AppData\\Local\\<Org>\\<App>).
+    Call once at programme start-up, after QApplication is created and
+    before any QStandardPaths calls.
+    """
+    app = _require_qapp()
+    app.setOrganizationName(org_name)
+    app.setApplicationName(app_name)
+    # Workspace roots are cached per process; drop anything resolved under the old identity.
+    # Nothing is cached yet if the workspace module has not been imported.
+    workspace = sys.modules.get(f"{__package__}._workspace")
+    if workspace is not None:
+        workspace.invalidate_app_dirs()
@@ -0,0 +1,302 @@
+# Where to store the workspaces? How to calculate their IDs?
+from __future__ import annotations
+import functools
+import hashlib
+import os
+import re
+from pathlib import Path
+from dataclasses import dataclass
+
+from ._identity import _require_qapp
+
+# ---------- Roots ----------
+
+@dataclass(frozen=True, slots=True)
+class AppDirs:
+    root: Path
+    workspaces: Path
+    backups: Path
+    recovery: Path
+    logs: Path
+
+_APP_DIRS: AppDirs | None = None
+
+@functools.lru_cache(maxsize=1)
+def app_local_data_root() -> Path:
+    """
+    Root directory of the application (Windows: AppData\\Local\\<Org>\\<App>).
+    Queried from Qt once per process; changing the app identity later requires
+    ensure_app_identity (which clears the cache) or a restart.
+    """
+    from PySide6.QtCore import QStandardPaths
+    path = QStandardPaths.writableLocation(QStandardPaths.StandardLocation.AppLocalDataLocation)
+    if not path:
+        raise RuntimeError("Qt did not return the AppLocalDataLocation path.")
+    return Path(path)
+
+def ensure_base_dirs() -> AppDirs:
+    """
+    Creates the application's base folders (workspaces/backups/logs/recovery) and returns them.
+    Call at startup or before the first operation with a workspace.
+    The result is cached for the lifetime of the process (see invalidate_app_dirs).
+    """
+    global _APP_DIRS
+    if _APP_DIRS is not None:
+        return _APP_DIRS
+    root = app_local_data_root()
+    dirs = AppDirs(
+        root=root,
+        workspaces=root / "workspaces",
+        backups=root / "backups",
+        recovery=root / "recovery",
+        logs=root / "logs",
+    )
+
+    # One directory listing instead of a mkdir probe per folder.
+    existing = {entry.name for entry in os.scandir(root)} if root.exists() else set()
+    for directory in (dirs.workspaces, dirs.recovery, dirs.logs):
+        if directory.name not in existing:
+            directory.mkdir(parents=True, exist_ok=True)
+    _APP_DIRS = dirs
+    return dirs
+
+def invalidate_app_dirs() -> None:
+    "Drops the cached roots and workspace folders (e.g. after changing the app identity in tests)."
+    global _APP_DIRS
+    _APP_DIRS = None
+    app_local_data_root.cache_clear()
+    _HANDLES.clear()
+    _tmp_dir.cache_clear()
+
+# ---------- Project Key | Workspace Layout ----------
+
+def new_project_uid() -> str:
+    """
+    Generates a permanent project_uid (UUIDv4) for writing to meta/manifest.json.
+    It is recommended to use it as the workspace key (more stable than the file path).
+    """
+    b = bytearray(os.urandom(16))
+    b[6] = (b[6] & 0x0F) | 0x40  # version 4
+    b[8] = (b[8] & 0x3F) | 0x80  # RFC 4122 variant
+    h = b.hex()
+    return f"{h[:8]}-{h[8:12]}-{h[12:16]}-{h[16:20]}-{h[20:]}"
+
+def _sha256_64(data: bytes) -> int:
+    return int.from_bytes(hashlib.sha256(data).digest()[:8], "big")
+
+# 64-bit hash of the absolute container path; only used to avoid folder collisions.
+# Module-level so tests can monkeypatch it.
+_PATH_HASH = _sha256_64
+
+# str(container_path) -> UTF-8 bytes of the resolved absolute path, ready for hashing;
+# container files rarely move during a session.
+_RESOLVED_CACHE: dict[str, bytes] = {}
+
+def _resolved_path(container_path: str | Path) -> bytes:
+    key = str(container_path)
+    absolute_path = _RESOLVED_CACHE.get(key)
+    if absolute_path is None:
+        absolute_path = str(Path(container_path).resolve()).encode("utf-8")
+        _RESOLVED_CACHE[key] = absolute_path
+    return absolute_path
+
+def invalidate_resolved(container_path: str | Path | None = None) -> None:
+    """
+    Forgets the cached resolved path of a container (e.g. when a project is loaded/unloaded)
+    together with every workspace handle derived from it.
+    Without an argument both caches are cleared.
+    """
+    if container_path is None:
+        _RESOLVED_CACHE.clear()
+        _HANDLES.clear()
+        return
+    key = str(container_path)
+    _RESOLVED_CACHE.pop(key, None)
+    for handle_key in [k for k in _HANDLES if k[1] is not None and str(k[1]) == key]:
+        del _HANDLES[handle_key]
+
+# Canonical lowercase form, as written by new_project_uid.
+_UUID_RE = re.compile(r"\A[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}\Z")
+
+def is_uuid(s: str) -> bool:
+    return _UUID_RE.match(s) is not None
+
+def project_key(project_uid: str | None, container_path: str | Path | None = None) -> str:
+    """
+    Returns the stable key for the workspace folder.
+    Preference: project_uid (UUID).
+    Fallback: hash from the absolute path to .cldl (if project_uid is not yet available).
+    """
+    if project_uid and is_uuid(project_uid):
+        return project_uid
+    if container_path is None:
+        raise ValueError("You need either project_uid or container_path to calculate the key.")
+    digest = _PATH_HASH(_resolved_path(container_path))
+    return f"path_{digest:016x}"
+
+@dataclass(frozen=True)
+class WorkspaceHandle:
+    project_uid: str | None
+    container_path: str | Path | None
+    key: str
+    root: Path
+    unpacked: Path
+    lock: Path
+    session: Path
+
+def open_workspace(project_uid: str | None, container_path: str | Path | None = None) -> WorkspaceHandle:
+    """
+    Computes the project key once, creates the workspace root (and unpacked/) and
+    returns a handle holding all derived workspace paths.
+    """
+    dirs = ensure_base_dirs()
+    key = project_key(project_uid, container_path)
+    root = dirs.workspaces / key
+    # Only unpacked/ is a directory; lock.json and session.json are files.
+    unpacked = root / "unpacked"
+    unpacked.mkdir(parents=True, exist_ok=True)
+    return WorkspaceHandle(
+        project_uid=project_uid,
+        container_path=container_path,
+        key=key,
+        root=root,
+        unpacked=unpacked,
+        lock=root / "lock.json",
+        session=root / "session.json",
+    )
+
+# (project_uid, container_path) -> handle; a plain dict so single entries can be dropped.
+_HANDLES: dict[tuple[str | None, str | Path | None], WorkspaceHandle] = {}
+
+def _handle(project_uid: str | None, container_path: str | Path | None) -> WorkspaceHandle:
+    handle = _HANDLES.get((project_uid, container_path))
+    if handle is None:
+        handle = open_workspace(project_uid, container_path)
+        _HANDLES[(project_uid, container_path)] = handle
+    return handle
+
+def invalidate_workspace(project_uid: str | None, container_path: str | Path | None = None) -> None:
+    """
+    Forgets the cached handle of one workspace (e.g. after its folder is deleted on project
+    close), so the next lookup recomputes the key and recreates the folders.
+    """
+    _HANDLES.pop((project_uid, container_path), None)
+    if container_path is not None:
+        _RESOLVED_CACHE.pop(str(container_path), None)
+
+def workspace_root(project_uid: str | None, container_path: str | Path | None = None) -> Path:
+    """
+    Returns the workspace root of the given project
+    <AppLocalData>/workspaces/<project_key>/
+    """
+    return _handle(project_uid, container_path).root
+
+def unpacked_dir(project_uid: str | None, container_path: str | Path | None = None) -> Path:
+    """
+    Folder with an unpacked CLDL structure:
+    <workspace_root>/unpacked/
+    """
+    return _handle(project_uid, container_path).unpacked
+
+def lock_path(project_uid: str | None, container_path: str | Path | None = None) -> Path:
+    """
+    Lock file created in a workspace
+    """
+    return _handle(project_uid, container_path).lock
+
+def session_path(project_uid: str | None, container_path: str | Path | None = None) -> Path:
+    """
+    Session metadata (what is open, when, what format version, etc.)
+    """
+    return _handle(project_uid, container_path).session
+
+@functools.lru_cache(maxsize=1)
+def _tmp_dir() -> Path:
+    path = ensure_base_dirs().root / "tmp"
+    path.mkdir(parents=True, exist_ok=True)
+    return path
+
+def pack_temp_path(container_path: str | Path) -> Path:
+    """
+    The path of the temporary file for atomic packaging:
+    <workspace_root>/tmp/<name>.tmp.cldl
+    """
+    return _tmp_dir() / f"{Path(container_path).stem}.tmp.cldl"
+
+def debug_paths() -> None:
+    """
+    Debug helper for the editor.workspace path helpers.
+    Prints all key paths and derived values.
+
+    Does nothing unless the CLDL_DEBUG_PATHS environment variable is set.
+
+    Usage (e.g. from main after QApplication is created):
+        ensure_app_identity("ChiharaYakou", "CLDL Editor")
+        debug_paths()
+    """
+    if not os.environ.get("CLDL_DEBUG_PATHS"):
+        return
+
+    app = _require_qapp()
+
+    print("\n=== debug_paths ===")
+
+    # App identity
+    try:
+        print("Organization:", app.organizationName())
+        print("Application :", app.applicationName())
+    except Exception as e:
+        print("[debug_paths] Could not read app identity:", e)
+
+    # Root + base dirs
+    try:
+        root = app_local_data_root()
+        print("AppLocalData root:", root)
+    except Exception as e:
+        print("[debug_paths] app_local_data_root() failed:", e)
+        root = None
+
+    try:
+        dirs = ensure_base_dirs()
+        print("\n-- Base dirs --")
+        print("root      :", dirs.root)
+        print("workspaces:", dirs.workspaces)
+        print("backups   :", dirs.backups)
+        print("recovery  :", dirs.recovery)
+        print("logs      :", dirs.logs)
+    except Exception as e:
+        print("[debug_paths] ensure_base_dirs() failed:", e)
+        dirs = None
+
+    # Sample keys/paths
+    try:
+        sample_uid = new_project_uid()
+    except Exception:
+        sample_uid = None
+
+    # Paths are only derived here, not created, so no junk workspace is left behind.
+    print("\n-- Workspace derivations (sample) --")
+    try:
+        if sample_uid and dirs:
+            sample_root = dirs.workspaces / project_key(sample_uid)
+            print("sample project_uid:", sample_uid)
+            print("project_key(uid)  :", project_key(sample_uid))
+            print("workspace_root    :", sample_root)
+            print("unpacked_dir      :", sample_root / "unpacked")
+            print("lock_path         :", sample_root / "lock.json")
+            print("session_path      :", sample_root / "session.json")
+    except Exception as e:
+        print("[debug_paths] Workspace derivations failed:", e)
+
+    # Fallback key from a container path
+    print("\n-- Fallback key (container path) --")
+    try:
+        # Change this to a real .cldl path if you want deterministic output.
+        fake_container = Path.cwd() / "sample.cldl"
+        print("fake container path:", fake_container)
+        print("project_key(path)  :", project_key(None, fake_container))
+        print("pack_temp_path     :", pack_temp_path(fake_container))
+    except Exception as e:
+        print("[debug_paths] Fallback key derivation failed:", e)
+
+    print("=== end debug_paths ===\n")